@@ -6,92 +6,263 @@ This script shows how to automate backups using mdump as a library
 
 import os
 import sys
-from pathlib import Path
-from mdump import MySQLBackupTool
+import time
+import sched
+import shutil
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+log = logging.getLogger("mdump.auto")
+
+# Resolved once so every dump runs the same binary without a PATH lookup
+MYSQLDUMP = shutil.which('mysqldump')
+
+# Specific databases to backup
+TARGET_DATABASES = ('my_app', 'logs', 'users')  # Change for your DBs
+
+def trunc(items, n=20):
+    """Returns at most n items for logging, marking the rest with an ellipsis"""
+    return items if len(items) <= n else list(items[:n]) + ['…']
+
+@dataclass(frozen=True)
+class BackupConfig:
+    """Validated, immutable settings for an automated backup"""
+    host: str = 'localhost'
+    user: str = 'root'
+    password: str = ''
+    port: int = 3306
+    output_path: str = './automated_backups/'  # Can be directory or specific filename
+    threads: int = 0  # Concurrent dumps; 0 = min(CPU count, number of databases); mydumper uses mydumper_threads
+    compress: Optional[bool] = None  # Protocol compression; None = only for remote servers
+    single_transaction: bool = True
+    quick: bool = True
+    buffer_size: int = 4 * 1024 * 1024  # Dump data is written to disk in chunks of this size
+    backend: str = 'mysqldump'  # 'mydumper' dumps the tables of each database in parallel
+    mydumper_threads: int = 8
+    
+    @property
+    def output_dir(self):
+        """Directory part of output_path (same rule as MySQLBackupTool)"""
+        if self.output_path.endswith(('.zip', '.tar', '.tar.gz', '.tar.zst')):
+            return os.path.dirname(self.output_path) or '.'
+        return self.output_path
+    
+    def __post_init__(self):
+        if not 0 < self.port < 65536:
+            raise ValueError(f"Invalid port: {self.port}")
+        if self.threads < 0:
+            raise ValueError(f"Invalid threads: {self.threads}")
+        if self.backend not in ('mysqldump', 'mydumper'):
+            raise ValueError(f"Unknown backend: {self.backend}")
+
+def create_backup_tool(config):
+    """Creates a MySQLBackupTool from a BackupConfig, creating its output directory first"""
+    # Imported here so loading this module doesn't pull in mysql-connector,
+    # rich and click unless a backup actually runs
+    from mdump import LOCAL_HOSTS, MySQLBackupTool
+    
+    # Create the output directory once, up front
+    os.makedirs(config.output_dir, exist_ok=True)
+    
+    return MySQLBackupTool(
+        host=config.host,
+        user=config.user,
+        password=config.password,
+        port=config.port,
+        output_path=config.output_path,  # Note: changed from output_dir
+        # Same default as the CLI: compressing a local connection only costs CPU
+        compress=config.host not in LOCAL_HOSTS if config.compress is None else config.compress,
+        single_transaction=config.single_transaction,
+        quick=config.quick,
+        buffer_size=config.buffer_size,
+        backend=config.backend,
+        mydumper_threads=config.mydumper_threads,
+        mysqldump_path=MYSQLDUMP,
+        create_output_dir=False  # Created once by the caller
+    )
 
 def automated_backup():
     """Example of automated backup"""
     
     # Configuration - CHANGE THESE VALUES
-    config = {
-        'host': 'localhost',
-        'user': 'root', 
-        'password': 'your_password_here',  # DON'T hardcode passwords in production!
-        'port': 3306,
-        'output_path': './automated_backups/'  # Can be directory or specific filename
-    }
+    config = BackupConfig(
+        host='localhost',
+        user='root',
+        password='your_password_here',  # DON'T hardcode passwords in production!
+        port=3306,
+        output_path='./automated_backups/'
+    )
     
-    # Specific databases to backup
-    target_databases = ['my_app', 'logs', 'users']  # Change for your DBs
+    log.info("=== Automated Backup ===")
     
-    print("=== Automated Backup ===")
+    # Nothing to do: don't even open a connection
+    if not TARGET_DATABASES:
+        log.error("No target databases configured")
+        return False
+    
+    if config.backend == 'mysqldump' and MYSQLDUMP is None:
+        log.error("mysqldump not found in PATH; install the MySQL client")
+        return False
     
     # Create backup tool
-    backup_tool = MySQLBackupTool(
-        host=config['host'],
-        user=config['user'],
-        password=config['password'],
-        port=config['port'],
-        output_path=config['output_path']  # Note: changed from output_dir
-    )
+    backup_tool = create_backup_tool(config)
     
     try:
         # Connect
         if not backup_tool.connect():
-            print("Error connecting to MySQL")
-            return False
-        
-        # Get available databases
-        available_dbs = backup_tool.get_databases()
-        
-        # Filter only the ones we want
-        databases_to_backup = [db for db in target_databases if db in available_dbs]
-        
-        if not databases_to_backup:
-            print("Specified databases not found")
+            log.error("Error connecting to MySQL")
             return False
         
-        print(f"Backing up: {databases_to_backup}")
-        
-        # Create backup
-        backup_file = backup_tool.create_backup(databases_to_backup)
-        
-        if backup_file:
-            print(f"✅ Backup successful: {backup_file}")
-            return True
-        else:
-            print("❌ Backup error")
-            return False
+        return backup_databases(backup_tool, TARGET_DATABASES, config.threads)
             
     except Exception as e:
-        print(f"Error: {e}")
+        log.error("Error: %s", e)
         return False
     finally:
         backup_tool.close_connection()
 
+def backup_databases(backup_tool, target_databases, threads=0):
+    """Backs up the target databases that exist, using an already connected tool"""
+    # Ask the server only about the databases we want
+    # (as a set for O(1) membership tests)
+    available_dbs = frozenset(backup_tool.get_databases(filter_in=target_databases))
+    
+    # Filter only the ones we want, keeping target order and dropping
+    # duplicates so no database is dumped twice
+    databases_to_backup = [db for db in dict.fromkeys(target_databases)
+                           if db in available_dbs]
+    
+    if not databases_to_backup:
+        log.error("Specified databases not found")
+        return False
+    
+    log.info("Backing up %d database(s): %s", len(databases_to_backup), trunc(databases_to_backup))
+    
+    # Dump databases concurrently, one mysqldump process per database;
+    # mydumper parallelizes inside each database, so it dumps one at a time
+    if backup_tool.backend == 'mydumper':
+        backup_tool.threads = 1
+    else:
+        backup_tool.threads = threads or min(os.cpu_count() or 1, len(databases_to_backup))
+    
+    # Create backup
+    backup_file = backup_tool.create_backup(databases_to_backup)
+    
+    if backup_file:
+        log.info("✅ Backup successful: %s", backup_file)
+        return True
+    else:
+        log.error("❌ Backup error")
+        return False
+
 def scheduled_backup_example():
     """
     Example of how to schedule backups using cron
     
     To schedule this script in cron, add a line like:
-    0 2 * * * cd /path/to/mdump && python backup_automatico.py
+    0 2 * * * cd /path/to/mdump && python automated_backup.py
     
     This will run the backup every day at 2 AM
     """
     
     # To use environment variables (more secure):
-    config = {
-        'host': os.getenv('MYSQL_HOST', 'localhost'),
-        'user': os.getenv('MYSQL_USER', 'root'),
-        'password': os.getenv('MYSQL_PASSWORD', ''),
-        'port': int(os.getenv('MYSQL_PORT', '3306')),
-        'output_path': os.getenv('BACKUP_PATH', './backups/')  # Can be dir or filename
-    }
+    env = os.environ.get
+    
+    # Empty or invalid MYSQL_PORT falls back to the default port
+    try:
+        port = int(env('MYSQL_PORT') or 3306)
+    except ValueError:
+        port = 3306
+    
+    config = BackupConfig(
+        host=env('MYSQL_HOST') or 'localhost',
+        user=env('MYSQL_USER') or 'root',
+        password=env('MYSQL_PASSWORD', ''),
+        port=port,
+        output_path=env('BACKUP_PATH') or './backups/'  # Can be dir or filename
+    )
     
     # The rest of the code would be the same...
-    pass
+    return config
+
+def scheduled_backup_daemon(target_databases=TARGET_DATABASES, hour=2, minute=0):
+    """
+    Long-running alternative to the cron job
+    
+    Keeps one process and one MySQL connection alive between runs, so the
+    interpreter startup, driver import and authentication are paid once
+    instead of on every backup. The connection is pinged (and re-opened if
+    the server dropped it) before each run.
+    
+    Example systemd unit (/etc/systemd/system/mdump-backup.service):
+    
+        [Unit]
+        Description=mdump scheduled MySQL backups
+        After=network-online.target mysql.service
+    
+        [Service]
+        WorkingDirectory=/path/to/mdump
+        EnvironmentFile=/etc/mdump.env
+        ExecStart=/path/to/mdump/.venv/bin/python automated_backup.py --daemon
+        Restart=on-failure
+    
+        [Install]
+        WantedBy=multi-user.target
+    """
+    if not target_databases:
+        log.error("No target databases configured")
+        return False
+    
+    config = scheduled_backup_example()
+    if config.backend == 'mysqldump' and MYSQLDUMP is None:
+        log.error("mysqldump not found in PATH; install the MySQL client")
+        return False
+    
+    backup_tool = create_backup_tool(config)
+    scheduler = sched.scheduler(time.time, time.sleep)
+    
+    def next_run():
+        now = datetime.now()
+        run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        return run_at.timestamp()
+    
+    def run():
+        try:
+            if backup_tool.ping(reconnect=True):
+                backup_databases(backup_tool, target_databases, config.threads)
+            else:
+                log.error("Error connecting to MySQL")
+        except Exception as e:
+            log.error("Error: %s", e)
+        scheduler.enterabs(next_run(), 1, run)
+    
+    try:
+        # Inside the try: the tool has already written its credentials file,
+        # which close_connection removes even if this first connect fails
+        if not backup_tool.connect():
+            log.error("Error connecting to MySQL")
+            return False
+        
+        scheduler.enterabs(next_run(), 1, run)
+        scheduler.run()
+    except KeyboardInterrupt:
+        log.info("Scheduler stopped")
+    finally:
+        backup_tool.close_connection()
+    return True
 
 if __name__ == '__main__':
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'),
+                        format='%(asctime)s %(levelname)s %(message)s')
+    
+    # Entry point of the systemd unit in scheduled_backup_daemon's docstring
+    if sys.argv[1:] == ['--daemon']:
+        sys.exit(0 if scheduled_backup_daemon() else 1)
+    
     print("⚠️  IMPORTANT: This is just an example!")
     print("You must modify the configuration variables before using.")
     print("")
@@ -100,7 +271,7 @@ if __name__ == '__main__':
     # automated_backup()
     
     print("To use this script:")
-    print("1. Modify the configuration in the automated_backup() function")
-    print("2. Specify your databases in target_databases")
+    print("1. Modify the BackupConfig in the automated_backup() function")
+    print("2. Specify your databases in TARGET_DATABASES")
     print("3. Uncomment the call to automated_backup()")
     print("4. For more security, use environment variables for passwords")
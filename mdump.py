@@ -5,41 +5,252 @@ A command-line tool for creating MySQL database backups
 """
 
 import os
+import re
 import sys
-import tarfile
+import gzip
 import subprocess
 import getpass
 import shutil
+import queue
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import click
-import mysql.connector
-from mysql.connector import Error
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
 from rich.panel import Panel
-from tabulate import tabulate
 
 console = Console()
 
+# Chunk size used when streaming dump data between processes and files
+COPY_BUFSIZE = 1024 * 1024
+
+# Default write buffer for dump files; mysqldump emits many small writes
+WRITE_BUFSIZE = 4 * 1024 * 1024
+
+# Server schemas that are never offered for backup
+SYSTEM_DATABASES = ('information_schema', 'performance_schema', 'mysql', 'sys')
+
+# Hosts for which mysqldump protocol compression would only waste CPU
+LOCAL_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+# Copy buffer for tar members; tarfile's 16 KiB default means a Python-level
+# read()/write() round trip every 16 KiB of dump data
+TAR_BUFSIZE = 2 * 1024 * 1024
+
+# gzip level for per-database dumps (same default as the gzip CLI)
+DUMP_COMPRESSLEVEL = 6
+
+# zstd level for per-database dumps in .tar.zst backups (the zstd CLI default)
+ZSTD_LEVEL = 3
+
+# How much of the end of mysqldump's stderr is kept for its error message
+STDERR_TAIL = 64 * 1024
+
+# stderr lines that mean the dump has failed; anything else (GTID notices,
+# deprecation warnings, ...) is only kept for the error message
+DUMP_ERRORS = (b'mysqldump: Got error', b"Couldn't execute", b'ERROR ')
+
+# Printed by mysql after each restored dump, to tell when it has been fully applied
+RESTORE_MARKER = 'mdump-restore-done'
+
+# One item of a database selection: a number or a range such as "3-5"
+SELECTION_ITEM = re.compile(r'^\s*(\d+)(?:\s*-\s*(\d+))?\s*$')
+
+# Supported backup archive formats, longest suffix first
+ARCHIVE_SUFFIXES = ('.tar.gz', '.tar.zst', '.tar')
+
+
+def sql_database_name(sql_file):
+    """Returns the database name of a dump path or archive member (db.sql, db.sql.gz, db.sql.zst or db.mydumper)"""
+    name = sql_file.name
+    for suffix in ('.sql.gz', '.sql.zst', '.sql', '.mydumper'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return sql_file.stem
+
+
+def archive_suffix(name):
+    """Returns the archive format suffix of a backup filename, or None"""
+    for suffix in ARCHIVE_SUFFIXES:
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
+def write_defaults_file(host, user, password, port):
+    """Writes client credentials to a private option file for --defaults-extra-file"""
+    # Option file values are quoted so any character in the password survives;
+    # line breaks are escaped too, or they would start a new option line
+    quoted = (password.replace('\\', '\\\\').replace('"', '\\"')
+              .replace('\n', '\\n').replace('\r', '\\r'))
+    # mkstemp creates the file readable by the owner only
+    fd, path = tempfile.mkstemp(prefix='mdump_', suffix='.cnf')
+    with os.fdopen(fd, 'w') as f:
+        f.write(f'[client]\nhost={host}\nport={port}\nuser={user}\npassword="{quoted}"\n')
+    return path
+
+
+def advise_sequential(f):
+    """Hints the kernel that a file will be read or written sequentially"""
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def drop_page_cache(path):
+    """Evicts a written-once file from the page cache so it doesn't push out hotter data"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Dirty pages can't be dropped, so flush them first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def chunk_conditions(key, bounds):
+    """--where conditions splitting a table on its integer key at the given bounds"""
+    column = '`' + key.replace('`', '``') + '`'
+    # The first and last ranges are open so rows outside the planned span are kept
+    yield f"{column} < {bounds[0]}"
+    for low, high in zip(bounds, bounds[1:]):
+        yield f"{column} >= {low} AND {column} < {high}"
+    yield f"{column} >= {bounds[-1]}"
+
+
+def open_gzip(fileobj, mode):
+    """Opens a gzip stream on fileobj, through python-isal's faster igzip when it is installed"""
+    try:
+        from isal import igzip
+    except ImportError:
+        return gzip.GzipFile(fileobj=fileobj, mode=mode, compresslevel=DUMP_COMPRESSLEVEL)
+    # Same gzip format; isal's levels only go up to 3
+    return igzip.IGzipFile(fileobj=fileobj, mode=mode, compresslevel=3)
+
+
+def open_sql_member(tf, member):
+    """Opens a dump inside a backup archive for binary reading, decompressing .sql.gz members"""
+    f = tf.extractfile(member)
+    if member.name.endswith('.gz'):
+        return open_gzip(f, 'rb')
+    # .sql.zst members are returned as-is for copy_zstd
+    return f
+
+
+def copy_zstd(src, dst):
+    """Decompresses a zstd stream from src into dst, with the zstd binary if available"""
+    if not shutil.which('zstd'):
+        import zstandard
+        zstandard.ZstdDecompressor().copy_stream(src, dst, read_size=COPY_BUFSIZE, write_size=COPY_BUFSIZE)
+        return
+    
+    proc = subprocess.Popen(['zstd', '-d', '-q', '-c'], stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def feed():
+        try:
+            shutil.copyfileobj(src, proc.stdin, COPY_BUFSIZE)
+        except BrokenPipeError:
+            # zstd exited early; its stderr says why
+            pass
+        finally:
+            proc.stdin.close()
+    
+    # zstd's input and output are both pipes, so one of them needs its own thread
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    try:
+        shutil.copyfileobj(proc.stdout, dst, COPY_BUFSIZE)
+    except BaseException:
+        # dst failed mid-stream; stop zstd so the feeder can't block on it
+        proc.kill()
+        raise
+    finally:
+        feeder.join()
+        stderr = proc.stderr.read()
+        proc.wait()
+    
+    if proc.returncode != 0:
+        raise OSError(f"zstd failed: {stderr.decode('utf-8', 'replace').strip()}")
+
 
 class MySQLBackupTool:
     """Main class for handling MySQL backups"""
     
-    def __init__(self, host, user, password, port=3306, output_path=None):
+    def __init__(self, host, user, password, port=3306, output_path=None, threads=1,
+                 compress=False, single_transaction=True, quick=True,
+                 buffer_size=WRITE_BUFSIZE, backend='mysqldump', mydumper_threads=4,
+                 mysqldump_path=None, create_output_dir=True, chunk_rows=0):
         self.host = host
         self.user = user
         self.password = password
         self.port = port
         self.connection = None
         self.output_path = output_path
+        # Number of concurrent mysqldump processes
+        self.threads = max(1, threads)
+        # mysqldump tuning: protocol compression for remote servers,
+        # consistent InnoDB snapshot, and row-by-row streaming
+        self.compress = compress
+        self.single_transaction = single_transaction
+        self.quick = quick
+        # Dump output is aggregated into writes of this size
+        self.buffer_size = buffer_size
+        # 'mysqldump' (single file per database) or 'mydumper' (parallel,
+        # per-table files in one directory per database)
+        if backend not in ('mysqldump', 'mydumper'):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self.mydumper_threads = max(1, mydumper_threads)
+        # Tables with more rows than this are dumped as parallel key ranges
+        # of about this many rows (0 = whole tables)
+        self.chunk_rows = max(0, chunk_rows)
+        self._chunk_plan = {}
+        # Bounds the mysqldump processes running at once, chunks included;
+        # sized again for each backup from the threads it uses
+        self._dump_slots = threading.Semaphore(self.threads)
+        # How many mysqldumps share the cores for compression; set per backup
+        self._parallel_dumps = self.threads
+        # Absolute path to mysqldump avoids a PATH lookup on every dump,
+        # so it is resolved here once unless the caller already did
+        self.mysqldump_path = mysqldump_path or shutil.which('mysqldump') or 'mysqldump'
+        # External compressor fed straight from mysqldump's pipe: multi-core
+        # pigz if available, else gzip; the gzip module is the last resort
+        self.pigz_path = shutil.which('pigz')
+        self.gzip_path = None if self.pigz_path else shutil.which('gzip')
+        # Same for zstd: the binary if available, else the zstandard module
+        self.zstd_path = shutil.which('zstd')
         self.output_dir = None
         self.custom_filename = None
+        # Callers that already created the directory can skip the mkdir
+        self.create_output_dir = create_output_dir
         
-        # Setup output path
+        # Setup output path; before the credentials file, which a failing
+        # mkdir would otherwise leave behind
         self._setup_output_path()
+        
+        # Credentials for mysqldump, so the password never appears on its command line
+        self.defaults_file = write_defaults_file(host, user, password, port)
+        # Dump processes of the current backup by database, to stop them on Ctrl-C
+        self._running = {}
+        # Set by terminate_dumps so dumps that haven't started yet never do
+        self._stopping = threading.Event()
+        # Cursor reused by the metadata queries, see _cursor()
+        self._cur = None
+        # Only the database name changes between mysqldump runs
+        self._dump_argv_prefix = self._build_dump_argv()
+        
+        # .tar.zst backups hold zstd-compressed dumps, the others gzip
+        if self.custom_filename and archive_suffix(self.custom_filename) == '.tar.zst':
+            self.dump_codec = 'zstd'
+        else:
+            self.dump_codec = 'gzip'
     
     def _setup_output_path(self):
         """Setup output path - can be directory or specific filename"""
@@ -52,7 +263,7 @@ class MySQLBackupTool:
             output_path = Path(self.output_path)
             
             # Check if it's meant to be a specific file
-            if output_path.suffix in ['.zip', '.tar', '.tar.gz']:
+            if archive_suffix(output_path.name) or output_path.name.endswith('.zip'):
                 # User specified a specific filename
                 self.output_dir = output_path.parent
                 self.custom_filename = output_path.name
@@ -62,7 +273,8 @@ class MySQLBackupTool:
                 self.custom_filename = None
         
         # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.create_output_dir:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
         
         console.print(f"[dim]Output directory: {self.output_dir}[/dim]")
         if self.custom_filename:
@@ -70,6 +282,10 @@ class MySQLBackupTool:
     
     def connect(self):
         """Establishes MySQL connection"""
+        # Imported on first use: the driver is the slowest import and --help doesn't need it
+        import mysql.connector
+        from mysql.connector import Error
+        
         try:
             console.print(f"[yellow]Connecting to MySQL: {self.user}@{self.host}:{self.port}[/yellow]")
             
@@ -79,6 +295,8 @@ class MySQLBackupTool:
                 password=self.password,
                 port=self.port
             )
+            # A cursor from an earlier connection can't be reused
+            self._cur = None
             
             if self.connection.is_connected():
                 console.print("[green]✓ Connection successful[/green]")
@@ -88,21 +306,51 @@ class MySQLBackupTool:
             console.print(f"[red]✗ Connection error: {e}[/red]")
             return False
     
-    def get_databases(self):
-        """Gets the list of available databases"""
+    def ping(self, reconnect=True):
+        """Checks that the connection is alive, reconnecting if it was dropped"""
+        from mysql.connector import Error
+        
+        if not self.connection:
+            return self.connect()
+        
+        try:
+            self.connection.ping(reconnect=reconnect, attempts=3, delay=5)
+            return True
+        except Error as e:
+            console.print(f"[red]✗ Connection lost: {e}[/red]")
+            return False
+    
+    def _cursor(self):
+        """Returns the cursor shared by the metadata queries, creating it on first use"""
+        if self._cur is None:
+            self._cur = self.connection.cursor()
+        return self._cur
+    
+    def get_databases(self, filter_in=None):
+        """Gets the list of available databases, optionally only those in filter_in"""
+        from mysql.connector import Error
+        
         if not self.connection:
             return []
             
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SHOW DATABASES")
-            databases = [db[0] for db in cursor.fetchall()]
+            # System databases are filtered out on the server
+            system = ", ".join(["%s"] * len(SYSTEM_DATABASES))
+            query = f"SHOW DATABASES WHERE `Database` NOT IN ({system})"
+            params = list(SYSTEM_DATABASES)
+            if filter_in is not None:
+                names = list(filter_in)
+                if not names:
+                    return []
+                # Filter on the server so only matching names come back
+                placeholders = ", ".join(["%s"] * len(names))
+                query += f" AND `Database` IN ({placeholders})"
+                params += names
             
-            # Filter system databases
-            system_dbs = ['information_schema', 'performance_schema', 'mysql', 'sys']
-            user_databases = [db for db in databases if db not in system_dbs]
-            
-            cursor.close()
+            cursor = self._cursor()
+            cursor.execute(query, params)
+            # Rows are taken as they arrive rather than collected by fetchall() first
+            user_databases = [db for (db,) in cursor]
             return user_databases
             
         except Error as e:
@@ -120,34 +368,58 @@ class MySQLBackupTool:
         table.add_column("Database Name", style="magenta")
         table.add_column("Size", style="green")
         
+        # One query for all sizes instead of one round-trip per database
+        sizes = self.get_all_database_sizes(filter_in=databases)
+        
         for i, db_name in enumerate(databases, 1):
-            size = self.get_database_size(db_name)
-            table.add_row(str(i), db_name, size)
+            table.add_row(str(i), db_name, self._size_label(sizes, db_name))
         
         console.print(table)
     
-    def get_database_size(self, db_name):
-        """Gets the approximate size of a database"""
+    def get_all_database_sizes(self, filter_in=None):
+        """Gets the approximate size in MB of every database, optionally only those in filter_in, in a single query"""
+        from mysql.connector import Error
+        
         try:
-            cursor = self.connection.cursor()
-            query = """
+            # System schemas are skipped on the server, so their tables are never read
+            system = ", ".join(["%s"] * len(SYSTEM_DATABASES))
+            where = f"table_schema NOT IN ({system})"
+            params = list(SYSTEM_DATABASES)
+            if filter_in is not None:
+                names = list(filter_in)
+                if not names:
+                    return {}
+                placeholders = ", ".join(["%s"] * len(names))
+                where += f" AND table_schema IN ({placeholders})"
+                params += names
+            
+            cursor = self._cursor()
+            query = f"""
                 SELECT 
+                    table_schema,
                     ROUND(SUM(data_length + index_length) / 1024 / 1024, 2) AS 'DB Size in MB'
                 FROM information_schema.tables 
-                WHERE table_schema = %s
+                WHERE {where}
                 GROUP BY table_schema
             """
-            cursor.execute(query, (db_name,))
-            result = cursor.fetchone()
-            cursor.close()
+            cursor.execute(query, params)
+            sizes = {schema: size for schema, size in cursor}
+            return sizes
             
-            if result and result[0]:
-                return f"{result[0]} MB"
-            else:
-                return "< 1 MB"
-                
         except Error:
+            return None
+    
+    def get_database_size(self, db_name):
+        """Gets the approximate size of a database"""
+        return self._size_label(self.get_all_database_sizes(filter_in=[db_name]), db_name)
+    
+    def _size_label(self, sizes, db_name):
+        """Formats a database size from get_all_database_sizes for display"""
+        if sizes is None:
             return "N/A"
+        if sizes.get(db_name):
+            return f"{sizes[db_name]} MB"
+        return "< 1 MB"
     
     def select_databases(self, databases):
         """Allows user to select which databases to backup"""
@@ -188,27 +460,100 @@ class MySQLBackupTool:
                 console.print("[yellow]Please try again[/yellow]")
     
     def parse_selection(self, selection, max_num):
-        """Parses user selection (e.g., '1,3-5,7')"""
-        indices = set()
-        parts = selection.split(',')
+        """Parses user selection (e.g., '1,3-5,7') into a sorted list of unique numbers"""
+        ranges = []
         
-        for part in parts:
-            part = part.strip()
-            if '-' in part:
+        for part in selection.split(','):
+            match = SELECTION_ITEM.match(part)
+            if not match:
+                raise ValueError(f"Not a number or range: {part.strip()}")
+            
+            start = int(match.group(1))
+            if match.group(2) is not None:
                 # Range
-                start, end = part.split('-', 1)
-                start, end = int(start.strip()), int(end.strip())
+                end = int(match.group(2))
                 if start < 1 or end > max_num or start > end:
-                    raise ValueError(f"Invalid range: {part}")
-                indices.update(range(start, end + 1))
+                    raise ValueError(f"Invalid range: {part.strip()}")
             else:
                 # Individual number
-                num = int(part)
-                if num < 1 or num > max_num:
-                    raise ValueError(f"Number out of range: {num}")
-                indices.add(num)
+                end = start
+                if start < 1 or start > max_num:
+                    raise ValueError(f"Number out of range: {start}")
+            ranges.append((start, end))
+        
+        # Merge overlapping and adjacent ranges, so every number comes out once
+        # and in order without a set of every number to dedupe them
+        ranges.sort()
+        merged = []
+        for start, end in ranges:
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        
+        return [i for start, end in merged for i in range(start, end + 1)]
+    
+    def _plan_chunks(self, databases):
+        """Finds the tables above chunk_rows rows with an integer primary key, and the key values to split them at
+
+        Returns {database: (tables, views)}, with (table, key, bounds) per chunked table
+        and the database's views, which have to be restored after those tables.
+        """
+        from mysql.connector import Error
+        
+        plan = {}
+        if not self.chunk_rows or not self.connection:
+            return plan
         
-        return sorted(indices)
+        try:
+            placeholders = ", ".join(["%s"] * len(databases))
+            # Row counts are InnoDB estimates, good enough to size chunks
+            query = f"""
+                SELECT t.table_schema, t.table_name, t.table_rows, MIN(k.column_name)
+                FROM information_schema.tables t
+                JOIN information_schema.key_column_usage k
+                    ON k.table_schema = t.table_schema AND k.table_name = t.table_name
+                    AND k.constraint_name = 'PRIMARY'
+                JOIN information_schema.columns c
+                    ON c.table_schema = k.table_schema AND c.table_name = k.table_name
+                    AND c.column_name = k.column_name
+                WHERE t.table_schema IN ({placeholders})
+                    AND t.table_type = 'BASE TABLE' AND t.table_rows > %s
+                GROUP BY t.table_schema, t.table_name, t.table_rows
+                HAVING COUNT(*) = 1
+                    AND MIN(c.data_type) IN ('tinyint', 'smallint', 'mediumint', 'int', 'bigint')
+            """
+            cursor = self._cursor()
+            cursor.execute(query, [*databases, self.chunk_rows])
+            candidates = list(cursor)
+            
+            for db_name, table, rows, key in candidates:
+                quoted = ['`' + name.replace('`', '``') + '`' for name in (db_name, table, key)]
+                cursor.execute(f"SELECT MIN({quoted[2]}), MAX({quoted[2]}) FROM {quoted[0]}.{quoted[1]}")
+                [(low, high)] = list(cursor)
+                if low is None:
+                    continue
+                # Even split of the key span; gaps in the keys only make chunks smaller
+                chunks = min(-(-rows // self.chunk_rows), high - low + 1)
+                if chunks < 2:
+                    continue
+                bounds = [low + (high - low + 1) * i // chunks for i in range(1, chunks)]
+                plan.setdefault(db_name, ([], []))[0].append((table, key, bounds))
+            
+            if plan:
+                placeholders = ", ".join(["%s"] * len(plan))
+                cursor.execute(f"""
+                    SELECT table_schema, table_name FROM information_schema.tables
+                    WHERE table_schema IN ({placeholders}) AND table_type = 'VIEW'
+                """, list(plan))
+                for db_name, view in cursor:
+                    plan[db_name][1].append(view)
+            
+        except Error as e:
+            console.print(f"[yellow]Could not plan table chunks, dumping whole tables: {e}[/yellow]")
+            return {}
+        
+        return plan
     
     def create_backup(self, databases):
         """Creates backup of selected databases"""
@@ -217,7 +562,45 @@ class MySQLBackupTool:
             return None
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_files = []
+        tar_file = self.archive_path(timestamp)
+        
+        try:
+            with open(tar_file, 'wb', buffering=TAR_BUFSIZE) as raw:
+                advise_sequential(raw)
+                tf, zstd = self.open_archive(raw, archive_suffix(tar_file.name))
+                try:
+                    archived = self._dump_into_archive(databases, tf)
+                finally:
+                    error = self.close_archive(tf, zstd)
+            
+            if error:
+                console.print(f"[red]Error writing archive: {error}[/red]")
+            elif not archived:
+                console.print("[red]Could not create any backup[/red]")
+            else:
+                # The archive won't be read again soon; keep the page cache for the database
+                drop_page_cache(tar_file)
+                return tar_file
+            
+        except Exception as e:
+            console.print(f"[red]Error writing archive: {e}[/red]")
+        except KeyboardInterrupt:
+            # Don't leave a truncated archive behind
+            if tar_file.exists():
+                tar_file.unlink()
+            raise
+        
+        if tar_file.exists():
+            tar_file.unlink()
+        return None
+    
+    def _dump_into_archive(self, databases, tf):
+        """Dumps the databases concurrently, adding each to the archive as it finishes"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
+        archived = 0
+        self._running = {}
+        self._stopping.clear()
         
         with Progress(
             SpinnerColumn(),
@@ -225,94 +608,404 @@ class MySQLBackupTool:
             console=console
         ) as progress:
             
-            for db_name in databases:
-                task = progress.add_task(f"Backing up {db_name}...", total=None)
-                
-                # SQL files now use only the database name without timestamp
-                sql_file = self.output_dir / f"{db_name}.sql"
+            if self.backend == 'mydumper':
+                dump, suffix = self.dump_database_mydumper, '.mydumper'
+            elif self.dump_codec == 'zstd':
+                dump, suffix = self.dump_database, '.sql.zst'
+            else:
+                dump, suffix = self.dump_database, '.sql.gz'
+            
+            if self.backend == 'mysqldump':
+                # Metadata queries stay on this thread; the connection isn't thread-safe
+                self._chunk_plan = self._plan_chunks(databases)
+            
+            # Each dump runs in its own process with its own connection,
+            # so databases can be dumped concurrently
+            workers = min(len(databases), self.threads)
+            self._dump_slots = threading.Semaphore(self.threads)
+            # A few big databases get all the cores between them, rather than
+            # one core each as if every thread were busy
+            processes = sum(len(self._chunked_dump_argvs(db_name, *self._chunk_plan[db_name]))
+                            if db_name in self._chunk_plan else 1 for db_name in databases)
+            self._parallel_dumps = min(processes, self.threads)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for db_name in databases:
+                    task = progress.add_task(f"Backing up {db_name}...", total=None)
+                    
+                    # SQL files now use only the database name without timestamp
+                    sql_file = self.output_dir / f"{db_name}{suffix}"
+                    
+                    future = executor.submit(dump, db_name, sql_file)
+                    futures[future] = (db_name, sql_file, task)
                 
-                if self.dump_database(db_name, sql_file):
-                    backup_files.append(sql_file)
-                    progress.update(task, description=f"✓ {db_name} completed")
-                else:
-                    progress.update(task, description=f"✗ {db_name} failed")
-        
-        if backup_files:
-            return self.compress_backups(backup_files, timestamp)
-        else:
-            console.print("[red]Could not create any backup[/red]")
-            return None
+                try:
+                    for future in as_completed(futures):
+                        db_name, sql_file, task = futures[future]
+                        if not future.result():
+                            progress.update(task, description=f"✗ {db_name} failed")
+                            continue
+                        
+                        # Archive each dump as soon as it is done, while the others
+                        # are still running, and drop its file right away so only
+                        # the archive is left growing on disk
+                        tf.add(sql_file, arcname=sql_file.name)
+                        if sql_file.is_dir():
+                            shutil.rmtree(sql_file)
+                        else:
+                            sql_file.unlink()
+                        archived += 1
+                        progress.update(task, description=f"✓ {db_name} completed")
+                except BaseException:
+                    # Ctrl-C or a failed archive write: drop the queued dumps and
+                    # stop the running ones instead of waiting for them to finish
+                    # (each removes its partial output as it fails)
+                    for future in futures:
+                        future.cancel()
+                    self.terminate_dumps()
+                    raise
+        
+        return archived
+    
+    def _build_dump_argv(self):
+        """Builds the mysqldump arguments shared by every database of a backup"""
+        cmd = [
+            self.mysqldump_path,
+            f'--defaults-extra-file={self.defaults_file}',  # Must be the first option
+            '--routines',
+            '--triggers',
+            '--events',
+            '--add-drop-database',
+            '--create-options',
+            # Restore-friendly output: multi-row INSERTs, index builds deferred
+            # to the end of each table, and one transaction per table
+            # (mysqldump already turns off unique and foreign key checks)
+            '--extended-insert',
+            '--disable-keys',
+            '--no-autocommit',
+            '--net-buffer-length=1048576',
+            # Rows larger than the 24 MB client default would abort the dump
+            '--max-allowed-packet=1G'
+        ]
+        if self.single_transaction:
+            # The snapshot is already consistent; table locks would only block writers
+            cmd.extend(['--single-transaction', '--skip-lock-tables'])
+        if self.quick:
+            cmd.append('--quick')
+        if self.compress:
+            cmd.append('--compress')
+        return cmd
     
     def dump_database(self, db_name, output_file):
         """Executes mysqldump for a specific database"""
+        try:
+            chunked = self._chunk_plan.get(db_name)
+            if chunked:
+                error = self._dump_chunked(db_name, output_file, *chunked)
+            else:
+                error = self._run_dump([*self._dump_argv_prefix, db_name], output_file, db_name)
+            
+            if error is None:
+                return True
+            else:
+                console.print(f"[red]Error in mysqldump for {db_name}: {error}[/red]")
+                # Remove partial file
+                if output_file.exists():
+                    output_file.unlink()
+                return False
+                
+        except FileNotFoundError:
+            console.print("[red]Error: mysqldump not found in PATH[/red]")
+            console.print("[yellow]Make sure MySQL client is installed[/yellow]")
+            return False
+        except Exception as e:
+            console.print(f"[red]Unexpected error: {e}[/red]")
+            return False
+    
+    def _chunked_dump_argvs(self, db_name, tables, views):
+        """mysqldump commands whose outputs, in order, restore a database with chunked tables"""
+        prefix = self._dump_argv_prefix
+        table_only = [*prefix, '--skip-routines', '--skip-events']
+        skipped = [*(table for table, _, _ in tables), *views]
+        # Everything but the big tables and the views, which may read them
+        cmds = [[*prefix, *(f'--ignore-table={db_name}.{name}' for name in skipped), db_name]]
+        for table, key, bounds in tables:
+            cmds.append([*table_only, '--skip-triggers', '--no-data', db_name, table])
+            for where in chunk_conditions(key, bounds):
+                cmds.append([*table_only, '--skip-triggers', '--no-create-info',
+                             f'--where={where}', db_name, table])
+            # Triggers go in only once the rows are loaded, so the inserts don't fire them
+            cmds.append([*table_only, '--triggers', '--no-create-info', '--no-data', db_name, table])
+        if views:
+            cmds.append([*table_only, '--skip-triggers', '--no-data', db_name, *views])
+        return cmds
+    
+    def _run_dump(self, cmd, output_file, key, stop=None):
+        """Runs one mysqldump command into a compressed output_file, returns an error message or None"""
+        # terminate_dumps, or the caller setting stop, cancels the dump
+        stopped = lambda: self._stopping.is_set() or (stop is not None and stop.is_set())
+        # One of the backup's dump slots for as long as mysqldump runs
+        with self._dump_slots:
+            # The slot may have been a long wait; don't start what was cancelled meanwhile
+            if stopped():
+                return "Dump cancelled"
+            
+            # Stream mysqldump output straight into the compressor so no
+            # uncompressed copy of the dump ever touches the disk
+            with open(output_file, 'wb', buffering=self.buffer_size) as raw:
+                advise_sequential(raw)
+                cctx = None
+                if self.dump_codec == 'zstd' and not self.zstd_path:
+                    # Imported before mysqldump starts, so a missing module can't strand it
+                    import zstandard
+                    cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=self._compress_threads())
+                
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                self._running[key] = proc
+                # A stop that came after the check above missed this process
+                if stopped():
+                    proc.terminate()
+                stderr_lines = deque()
+                watcher = threading.Thread(target=self._watch_stderr, args=(proc, stderr_lines), daemon=True)
+                watcher.start()
+                try:
+                    if cctx is not None:
+                        with cctx.stream_writer(raw, closefd=False) as f:
+                            shutil.copyfileobj(proc.stdout, f, self.buffer_size)
+                        proc.stdout.close()
+                        proc.wait()
+                        error = None
+                    elif self.dump_codec == 'zstd' or self.pigz_path or self.gzip_path:
+                        error = self._pipe_to_compressor(proc, raw)
+                    else:
+                        with open_gzip(raw, 'wb') as f:
+                            shutil.copyfileobj(proc.stdout, f, self.buffer_size)
+                        proc.stdout.close()
+                        proc.wait()
+                        error = None
+                except BaseException:
+                    # A failed write (e.g. disk full) leaves nothing reading
+                    # mysqldump's output; don't leave it blocked on the pipe
+                    proc.kill()
+                    proc.wait()
+                    raise
+                watcher.join()
+            
+            if proc.returncode != 0:
+                error = (b''.join(stderr_lines).decode('utf-8', 'replace').strip()
+                         or f"mysqldump exited with code {proc.returncode}")
+            return error
+    
+    def _dump_chunked(self, db_name, output_file, tables, views):
+        """Dumps a database with its big tables split into key ranges dumped in parallel, returns an error message or None"""
+        cmds = self._chunked_dump_argvs(db_name, tables, views)
+        parts = [output_file.with_name(f"{output_file.name}.{i}") for i in range(len(cmds))]
+        keys = [f"{db_name}.{i}" for i in range(len(cmds))]
+        # Set when a part fails, so its siblings stop too
+        failed = threading.Event()
+        error = None
+        try:
+            # _run_dump takes a dump slot for each part, so these threads
+            # never run more mysqldumps than the backup's --threads
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                futures = [executor.submit(self._run_dump, cmd, part, key, failed)
+                           for cmd, part, key in zip(cmds, parts, keys)]
+                try:
+                    for future in as_completed(futures):
+                        error = future.result()
+                        if error is not None:
+                            break
+                finally:
+                    if error is not None or sys.exc_info()[0] is not None:
+                        # Queued parts never start; running ones are stopped
+                        failed.set()
+                        for future in futures:
+                            future.cancel()
+                        for key in keys:
+                            proc = self._running.get(key)
+                            if proc is not None:
+                                proc.terminate()
+            if error is not None:
+                return error
+            
+            # gzip members and zstd frames can be concatenated, so the parts
+            # joined in order are one valid compressed dump
+            with open(output_file, 'wb', buffering=self.buffer_size) as out:
+                for part in parts:
+                    with open(part, 'rb') as f:
+                        shutil.copyfileobj(f, out, COPY_BUFSIZE)
+                    part.unlink()
+            return None
+        finally:
+            for part in parts:
+                if part.exists():
+                    part.unlink()
+    
+    def terminate_dumps(self):
+        """Stops the dump processes of the backup in progress"""
+        self._stopping.set()
+        for proc in list(self._running.values()):
+            proc.terminate()
+    
+    def _watch_stderr(self, proc, lines):
+        """Drains mysqldump's stderr into its last STDERR_TAIL bytes, stopping the dump at the first error it reports"""
+        size = 0
+        for line in proc.stderr:
+            lines.append(line)
+            size += len(line)
+            # Thousands of warnings must not pile up in memory
+            while size > STDERR_TAIL and len(lines) > 1:
+                size -= len(lines.popleft())
+            if any(error in line for error in DUMP_ERRORS):
+                # The dump is already doomed; don't let it run on for hours
+                proc.terminate()
+        proc.stderr.close()
+    
+    def _compress_threads(self):
+        """Compression threads per dump: the cores split between the dumps running in parallel"""
+        return max(1, (os.cpu_count() or 1) // self._parallel_dumps)
+    
+    def _pipe_to_compressor(self, proc, output):
+        """Pipes a running mysqldump into zstd/pigz/gzip, returns the compressor's error message or None"""
+        compress_threads = self._compress_threads()
+        if self.dump_codec == 'zstd':
+            compress_cmd = [self.zstd_path, '-q', '-c', f'-{ZSTD_LEVEL}', f'-T{compress_threads}']
+        elif self.pigz_path:
+            compress_cmd = [self.pigz_path, '-c', f'-{DUMP_COMPRESSLEVEL}', '-p', str(compress_threads)]
+        else:
+            compress_cmd = [self.gzip_path, '-c', f'-{DUMP_COMPRESSLEVEL}']
+        
+        compressor = subprocess.Popen(
+            compress_cmd,
+            stdin=proc.stdout,
+            stdout=output,
+            stderr=subprocess.PIPE
+        )
+        # The compressor now owns the read end; closing ours lets mysqldump
+        # get SIGPIPE if the compressor dies
+        proc.stdout.close()
+        proc.wait()
+        compressor_stderr = compressor.stderr.read()
+        compressor.wait()
+        
+        if compressor.returncode != 0:
+            return f"{compress_cmd[0]} failed: {compressor_stderr.decode('utf-8', 'replace')}"
+        return None
+    
+    def dump_database_mydumper(self, db_name, output_dir):
+        """Executes mydumper for a specific database into its own directory"""
         try:
             cmd = [
-                'mysqldump',
+                'mydumper',
+                # The password comes from the [client] group of the option file
+                f'--defaults-file={self.defaults_file}',
                 f'--host={self.host}',
                 f'--user={self.user}',
-                f'--password={self.password}',
                 f'--port={self.port}',
-                '--single-transaction',
+                f'--database={db_name}',
+                f'--outputdir={output_dir}',
+                f'--threads={self.mydumper_threads}',
+                # Split big tables into chunks so threads share the work evenly
+                f'--rows={self.chunk_rows or 100000}',
+                '--trx-consistency-only',
                 '--routines',
                 '--triggers',
                 '--events',
-                '--add-drop-database',
-                '--create-options',
-                db_name
+                '--compress'
             ]
+            if self.compress:
+                cmd.append('--compress-protocol')
             
-            with open(output_file, 'w') as f:
-                result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, text=True)
+            proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            self._running[db_name] = proc
+            _, stderr = proc.communicate()
             
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 return True
             else:
-                console.print(f"[red]Error in mysqldump for {db_name}: {result.stderr}[/red]")
-                # Remove partial file
-                if output_file.exists():
-                    output_file.unlink()
+                console.print(f"[red]Error in mydumper for {db_name}: {stderr}[/red]")
+                # Remove partial output
+                shutil.rmtree(output_dir, ignore_errors=True)
                 return False
                 
         except FileNotFoundError:
-            console.print("[red]Error: mysqldump not found in PATH[/red]")
-            console.print("[yellow]Make sure MySQL client is installed[/yellow]")
+            console.print("[red]Error: mydumper not found in PATH[/red]")
+            console.print("[yellow]Install mydumper or use the mysqldump backend[/yellow]")
             return False
         except Exception as e:
             console.print(f"[red]Unexpected error: {e}[/red]")
             return False
     
-    def compress_backups(self, backup_files, timestamp):
-        """Compresses all backup files into a tar.gz archive"""
+    def archive_path(self, timestamp):
+        """Path of the backup archive: the custom filename or a timestamped default"""
         if self.custom_filename:
             # User specified exact filename
             tar_file = self.output_dir / self.custom_filename
-            # Ensure it has .tar.gz extension
-            if not str(tar_file).endswith('.tar.gz'):
-                if tar_file.suffix in ['.zip', '.tar']:
-                    tar_file = tar_file.with_suffix('.tar.gz')
-                else:
-                    tar_file = tar_file.with_suffix(tar_file.suffix + '.tar.gz')
-        else:
-            # Generate default filename
-            tar_file = self.output_dir / f"mysql_backup_{timestamp}.tar.gz"
-        
-        try:
-            with tarfile.open(tar_file, 'w:gz') as tf:
-                for sql_file in backup_files:
-                    tf.add(sql_file, arcname=sql_file.name)
-            
-            # Clean up individual SQL files
-            for sql_file in backup_files:
-                sql_file.unlink()
-            
+            # zip archives aren't supported; such names get the default format
+            if archive_suffix(tar_file.name) is None:
+                tar_file = tar_file.with_suffix('.tar.gz')
             return tar_file
-            
-        except Exception as e:
-            console.print(f"[red]Error compressing files: {e}[/red]")
+        # Generate default filename
+        return self.output_dir / f"mysql_backup_{timestamp}.tar.gz"
+    
+    def open_archive(self, output, suffix):
+        """Opens a tar writer on output for the given format; returns it and the zstd process or stream, if any"""
+        import tarfile
+        
+        if suffix == '.tar.zst' and not self.zstd_path:
+            import zstandard
+            # Level 1 on all cores, as with the binary below
+            zstd = zstandard.ZstdCompressor(level=1, threads=-1).stream_writer(output, closefd=False)
+            tf = tarfile.open(fileobj=zstd, mode='w|', bufsize=TAR_BUFSIZE,
+                              copybufsize=TAR_BUFSIZE)
+            return tf, zstd
+        
+        if suffix == '.tar.zst':
+            # The dumps are zstd-compressed already; zstd stores such
+            # incompressible blocks almost as fast as it can copy them
+            zstd = subprocess.Popen(
+                [self.zstd_path, '-T0', '-1', '-q', '-c'],
+                stdin=subprocess.PIPE,
+                stdout=output,
+                stderr=subprocess.PIPE
+            )
+            tf = tarfile.open(fileobj=zstd.stdin, mode='w|', bufsize=TAR_BUFSIZE,
+                              copybufsize=TAR_BUFSIZE)
+            return tf, zstd
+        
+        if suffix == '.tar.gz':
+            # Dumps are already gzip-compressed, so the outer gzip layer is
+            # written uncompressed: it only keeps the archive a valid .tar.gz
+            tf = tarfile.open(fileobj=output, mode='w:gz', compresslevel=0, copybufsize=TAR_BUFSIZE)
+        else:
+            tf = tarfile.open(fileobj=output, mode='w:', copybufsize=TAR_BUFSIZE)
+        return tf, None
+    
+    def close_archive(self, tf, zstd):
+        """Finishes an archive from open_archive; returns an error message or None"""
+        tf.close()
+        if zstd is None:
+            return None
+        if not isinstance(zstd, subprocess.Popen):
+            # In-process compressor: errors are raised, not reported
+            zstd.close()
             return None
+        
+        zstd.stdin.close()
+        stderr = zstd.stderr.read()
+        zstd.wait()
+        if zstd.returncode != 0:
+            return stderr.decode('utf-8', 'replace').strip() or f"zstd exited with code {zstd.returncode}"
+        return None
     
     def close_connection(self):
-        """Closes MySQL connection"""
+        """Closes MySQL connection and removes the credentials file"""
+        if self.defaults_file:
+            os.unlink(self.defaults_file)
+            self.defaults_file = None
+        if self._cur is not None:
+            self._cur.close()
+            self._cur = None
         if self.connection and self.connection.is_connected():
             self.connection.close()
             console.print("[dim]Connection closed[/dim]")
@@ -321,15 +1014,30 @@ class MySQLBackupTool:
 class MySQLRestoreTool:
     """Class for handling MySQL backup restoration from tar.gz files"""
     
-    def __init__(self, host, user, password, port=3306):
+    def __init__(self, host, user, password, port=3306, threads=1, myloader_threads=4):
         self.host = host
         self.user = user
         self.password = password
         self.port = port
         self.connection = None
+        # Databases restored in parallel, each worker with its own mysql client
+        self.threads = max(1, threads)
+        # Parallel loader threads for mydumper backups
+        self.myloader_threads = max(1, myloader_threads)
+        # Database names on the server, fetched once and kept up to date
+        # by create_database/drop_database
+        self._db_cache = None
+        # Cursor shared by the database admin statements
+        self._cur = None
+        # Credentials for mysql, so the password never appears on its command line
+        self.defaults_file = write_defaults_file(host, user, password, port)
     
     def connect(self):
         """Establishes connection to MySQL server"""
+        # Imported on first use: the driver is the slowest import and --help doesn't need it
+        import mysql.connector
+        from mysql.connector import Error
+        
         try:
             console.print(f"[cyan]Connecting to MySQL server at {self.host}:{self.port}...[/cyan]")
             self.connection = mysql.connector.connect(
@@ -350,53 +1058,54 @@ class MySQLRestoreTool:
             console.print(f"[red]Connection error: {e}[/red]")
             return False
     
-    def extract_backup(self, tar_file_path):
-        """Extract tar.gz backup file and return list of SQL files"""
-        tar_path = Path(tar_file_path)
-        if not tar_path.exists():
-            console.print(f"[red]Error: Backup file {tar_file_path} not found[/red]")
-            return None
-        
-        # Create extraction directory
-        extract_dir = tar_path.parent / f"restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        extract_dir.mkdir(exist_ok=True)
-        
-        try:
-            console.print(f"[cyan]Extracting backup file...[/cyan]")
-            with tarfile.open(tar_path, 'r:gz') as tf:
-                tf.extractall(extract_dir)
-            
-            # Find all SQL files
-            sql_files = list(extract_dir.glob("*.sql"))
-            if not sql_files:
-                console.print("[red]No SQL files found in backup[/red]")
-                return None
-            
-            console.print(f"[green]✓ Extracted {len(sql_files)} SQL files[/green]")
-            return sql_files
-            
-        except Exception as e:
-            console.print(f"[red]Error extracting backup: {e}[/red]")
-            return None
+    def list_backup(self, tf):
+        """Return the dump members (SQL files and mydumper directories) of an open backup archive"""
+        dumps = []
+        for member in tf.getmembers():
+            # Dumps live at the top level; deeper entries are mydumper chunk files
+            if '/' in member.name:
+                continue
+            if member.isfile() and member.name.endswith(('.sql', '.sql.gz', '.sql.zst')):
+                dumps.append(member)
+            elif member.isdir() and member.name.endswith('.mydumper'):
+                dumps.append(member)
+        return dumps
+    
+    def dump_members(self, tf, member):
+        """Archive members making up a dump: the file itself, or a mydumper directory and its files"""
+        if not member.isdir():
+            return [member]
+        prefix = member.name + '/'
+        return [member] + [m for m in tf.getmembers() if m.name.startswith(prefix)]
+    
+    def _cursor(self):
+        """Returns the cursor shared by the admin statements, creating it on first use"""
+        if self._cur is None:
+            self._cur = self.connection.cursor()
+        return self._cur
     
     def database_exists(self, database_name):
         """Check if database exists"""
+        from mysql.connector import Error
+        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SHOW DATABASES")
-            databases = [db[0] for db in cursor.fetchall()]
-            cursor.close()
-            return database_name in databases
+            if self._db_cache is None:
+                cursor = self._cursor()
+                cursor.execute("SHOW DATABASES")
+                self._db_cache = {db for (db,) in cursor}
+            return database_name in self._db_cache
         except Error as e:
             console.print(f"[red]Error checking database: {e}[/red]")
             return False
     
     def create_database(self, database_name):
         """Create a new database"""
+        from mysql.connector import Error
+        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(f"CREATE DATABASE `{database_name}`")
-            cursor.close()
+            self._cursor().execute(f"CREATE DATABASE `{database_name}`")
+            if self._db_cache is not None:
+                self._db_cache.add(database_name)
             console.print(f"[green]✓ Created database: {database_name}[/green]")
             return True
         except Error as e:
@@ -405,60 +1114,226 @@ class MySQLRestoreTool:
     
     def drop_database(self, database_name):
         """Drop an existing database"""
+        from mysql.connector import Error
+        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(f"DROP DATABASE `{database_name}`")
-            cursor.close()
+            self._cursor().execute(f"DROP DATABASE `{database_name}`")
+            if self._db_cache is not None:
+                self._db_cache.discard(database_name)
             console.print(f"[yellow]⚠ Dropped database: {database_name}[/yellow]")
             return True
         except Error as e:
             console.print(f"[red]Error dropping database {database_name}: {e}[/red]")
             return False
     
-    def restore_database(self, sql_file):
-        """Restore database from SQL file using mysql command"""
-        database_name = sql_file.stem  # Get filename without extension
+    def restore_database_myloader(self, tf, member, files):
+        """Restore database from a mydumper directory in the archive using myloader"""
+        database_name = sql_database_name(member)
+        # myloader reads a directory, so this is the one dump that has to
+        # be extracted; only its own files are written to disk
+        extract_dir = Path(tempfile.mkdtemp(prefix='restore_', dir=Path(tf.name).parent))
+        dump_dir = extract_dir / member.name
         
         try:
-            # Build mysql command
-            mysql_cmd = [
-                'mysql',
+            console.print(f"[cyan]Extracting {member.name}...[/cyan]")
+            tf.extractall(extract_dir, members=files)
+            
+            myloader_cmd = [
+                'myloader',
+                # The password comes from the [client] group of the option file
+                f'--defaults-file={self.defaults_file}',
                 f'--host={self.host}',
                 f'--port={self.port}',
                 f'--user={self.user}',
-                f'--password={self.password}',
-                database_name
+                f'--directory={dump_dir}',
+                f'--database={database_name}',
+                f'--threads={self.myloader_threads}',
+                '--queries-per-transaction=50000',
+                '--overwrite-tables'
             ]
             
-            console.print(f"[cyan]Restoring {database_name} from {sql_file.name}...[/cyan]")
+            console.print(f"[cyan]Restoring {database_name} from {member.name} with myloader...[/cyan]")
+            result = subprocess.run(myloader_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
             
-            with open(sql_file, 'r', encoding='utf-8') as f:
-                result = subprocess.run(
-                    mysql_cmd,
-                    stdin=f,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+            if result.returncode != 0:
+                console.print(f"[red]Error restoring {database_name}: {result.stderr.decode('utf-8', 'replace')}[/red]")
+                return False
             
             console.print(f"[green]✓ Successfully restored database: {database_name}[/green]")
             return True
             
-        except subprocess.CalledProcessError as e:
-            console.print(f"[red]Error restoring {database_name}: {e.stderr}[/red]")
+        except FileNotFoundError:
+            console.print("[red]Error: myloader not found in PATH[/red]")
+            console.print("[yellow]Install mydumper to restore backups made with --engine mydumper[/yellow]")
             return False
         except Exception as e:
             console.print(f"[red]Unexpected error restoring {database_name}: {e}[/red]")
             return False
+        finally:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+    
+    def _start_mysql(self):
+        """Starts a mysql client that restores dumps read from its stdin"""
+        return subprocess.Popen(
+            ['mysql', f'--defaults-extra-file={self.defaults_file}',  # Must be the first option
+             '--batch', '--skip-column-names'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+    
+    def restore_database(self, tf, member, proc):
+        """Restore database from a SQL dump in the archive through a running mysql client"""
+        database_name = sql_database_name(member)
+        
+        try:
+            console.print(f"[cyan]Restoring {database_name} from {member.name}...[/cyan]")
+            
+            # The dump is streamed straight out of the archive into mysql,
+            # without being extracted to disk first
+            with open_sql_member(tf, member) as f:
+                try:
+                    proc.stdin.write(f"USE `{database_name}`;\n".encode())
+                    if member.name.endswith('.zst'):
+                        copy_zstd(f, proc.stdin)
+                    else:
+                        shutil.copyfileobj(f, proc.stdin, COPY_BUFSIZE)
+                    # Dumps made with --no-autocommit leave autocommit off for the
+                    # session, so commit whatever the dump left open; mysql runs
+                    # it all in order, so once it prints the marker every
+                    # statement before it has been applied
+                    proc.stdin.write(f"\nCOMMIT;\nSELECT '{RESTORE_MARKER}';\n".encode())
+                    proc.stdin.flush()
+                except BrokenPipeError:
+                    # mysql exited early; its stderr says why
+                    pass
+            
+            for line in proc.stdout:
+                if line.rstrip(b'\n') == RESTORE_MARKER.encode():
+                    break
+            else:
+                # mysql stops at the first error; the next dump gets a new client
+                _, stderr = proc.communicate()
+                console.print(f"[red]Error restoring {database_name}: {stderr.decode('utf-8', 'replace')}[/red]")
+                return False
+            
+            console.print(f"[green]✓ Successfully restored database: {database_name}[/green]")
+            return True
+            
+        except Exception as e:
+            console.print(f"[red]Unexpected error restoring {database_name}: {e}[/red]")
+            # The client may hold a partly fed dump; the next one gets a new client
+            proc.kill()
+            proc.communicate()
+            return False
+    
+    def _restore_worker(self, tar_path, work):
+        """Restores dumps from the work queue until it is empty; returns how many succeeded"""
+        import tarfile
+        
+        restored = 0
+        mysql = None
+        # Each worker reads through its own archive handle, and restores every
+        # dump it takes over one mysql client, so the connection and
+        # authentication happen once per worker rather than per database
+        with tarfile.open(tar_path, 'r:*', copybufsize=TAR_BUFSIZE) as tf:
+            try:
+                while True:
+                    try:
+                        member, files = work.get_nowait()
+                    except queue.Empty:
+                        break
+                    
+                    if member.isdir():
+                        restored += self.restore_database_myloader(tf, member, files)
+                        continue
+                    
+                    if mysql is None or mysql.returncode is not None:
+                        try:
+                            mysql = self._start_mysql()
+                        except OSError as e:
+                            console.print(f"[red]Error starting mysql: {e}[/red]")
+                            continue
+                    restored += self.restore_database(tf, member, mysql)
+            finally:
+                if mysql is not None and mysql.returncode is None:
+                    mysql.communicate()
+        return restored
     
     def restore_backup(self, tar_file_path):
         """Main method to restore backup from tar.gz file"""
+        import tarfile
+        
+        tar_path = Path(tar_file_path)
+        if not tar_path.exists():
+            console.print(f"[red]Error: Backup file {tar_file_path} not found[/red]")
+            return False
+        
         if not self.connect():
             return False
         
-        # Extract backup files
-        sql_files = self.extract_backup(tar_file_path)
+        tmp_tar = None
+        try:
+            if archive_suffix(tar_path.name) == '.tar.zst':
+                tmp_tar = self.decompress_zstd(tar_path)
+                if tmp_tar is None:
+                    return False
+            
+            try:
+                # 'r:*' reads both .tar.gz and plain .tar backups
+                tf = tarfile.open(tmp_tar or tar_path, 'r:*', copybufsize=TAR_BUFSIZE)
+            except Exception as e:
+                console.print(f"[red]Error reading backup: {e}[/red]")
+                return False
+            
+            with tf:
+                return self._restore_members(tf)
+        finally:
+            if tmp_tar is not None:
+                tmp_tar.unlink()
+    
+    def decompress_zstd(self, tar_path):
+        """Decompress a .tar.zst backup to a temporary tar next to it and return its path"""
+        # tarfile can't read zstd, and restore needs random access to the
+        # archive members, so the tar is unpacked once as a whole
+        fd, tmp_name = tempfile.mkstemp(prefix='restore_', suffix='.tar', dir=tar_path.parent)
+        tmp_tar = Path(tmp_name)
+        
+        try:
+            console.print(f"[cyan]Decompressing backup file...[/cyan]")
+            with os.fdopen(fd, 'wb') as out:
+                if not shutil.which('zstd'):
+                    import zstandard
+                    with open(tar_path, 'rb') as src:
+                        zstandard.ZstdDecompressor().copy_stream(src, out, read_size=COPY_BUFSIZE,
+                                                                 write_size=COPY_BUFSIZE)
+                    return tmp_tar
+                
+                result = subprocess.run(['zstd', '-d', '-q', '-c', str(tar_path)],
+                                        stdout=out, stderr=subprocess.PIPE)
+            
+            if result.returncode != 0:
+                console.print(f"[red]Error decompressing backup: {result.stderr.decode('utf-8', 'replace')}[/red]")
+                tmp_tar.unlink()
+                return None
+            
+            return tmp_tar
+            
+        except ImportError:
+            console.print("[red]Error: zstd not found in PATH and the zstandard package is not installed[/red]")
+            tmp_tar.unlink()
+            return None
+        except Exception as e:
+            console.print(f"[red]Error decompressing backup: {e}[/red]")
+            tmp_tar.unlink()
+            return None
+    
+    def _restore_members(self, tf):
+        """Restores every dump in an open backup archive"""
+        console.print(f"[cyan]Reading backup file...[/cyan]")
+        sql_files = self.list_backup(tf)
         if not sql_files:
+            console.print("[red]No SQL files found in backup[/red]")
             return False
         
         # Show found databases
@@ -469,8 +1344,8 @@ class MySQLRestoreTool:
         table.add_column("Status", style="yellow")
         
         for sql_file in sql_files:
-            database_name = sql_file.stem
-            file_size = sql_file.stat().st_size / 1024  # KB
+            database_name = sql_database_name(sql_file)
+            file_size = sum(m.size for m in self.dump_members(tf, sql_file)) / 1024  # KB
             exists = self.database_exists(database_name)
             status = "EXISTS" if exists else "NEW"
             table.add_row(database_name, f"{file_size:.1f} KB", status)
@@ -482,10 +1357,11 @@ class MySQLRestoreTool:
             console.print("[yellow]Restore cancelled[/yellow]")
             return False
         
-        # Process each database
-        success_count = 0
+        # Resolve every database first (prompts and admin statements stay on
+        # this thread), then restore the queued dumps in parallel
+        work = queue.Queue()
         for sql_file in sql_files:
-            database_name = sql_file.stem
+            database_name = sql_database_name(sql_file)
             
             if self.database_exists(database_name):
                 # Database exists, ask what to do
@@ -512,19 +1388,28 @@ class MySQLRestoreTool:
                 if not self.create_database(database_name):
                     continue
             
-            # Restore database
-            if self.restore_database(sql_file):
-                success_count += 1
+            work.put((sql_file, self.dump_members(tf, sql_file)))
         
-        # Cleanup extraction directory
-        import shutil
-        shutil.rmtree(sql_files[0].parent, ignore_errors=True)
+        # Restore databases
+        success_count = 0
+        workers = min(self.threads, work.qsize())
+        if workers:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._restore_worker, tf.name, work)
+                           for _ in range(workers)]
+                success_count = sum(future.result() for future in futures)
         
         console.print(f"\n[bold green]✅ Restore completed: {success_count}/{len(sql_files)} databases restored[/bold green]")
         return success_count > 0
     
     def close_connection(self):
-        """Closes MySQL connection"""
+        """Closes MySQL connection and removes the credentials file"""
+        if self.defaults_file:
+            os.unlink(self.defaults_file)
+            self.defaults_file = None
+        if self._cur is not None:
+            self._cur.close()
+            self._cur = None
         if self.connection and self.connection.is_connected():
             self.connection.close()
             console.print("[dim]Connection closed[/dim]")
@@ -542,7 +1427,14 @@ def cli():
 @click.option('-p', '--password', is_flag=True, help='Prompt for password')
 @click.option('-P', '--port', default=3306, help='MySQL server port')
 @click.option('-o', '--output', default=None, help='Output directory or filename (default: ./mysql_backup_TIMESTAMP/)')
-def backup(host, user, password, port, output):
+@click.option('--no-wire-compress', is_flag=True, help='Disable client/server protocol compression (always off for localhost)')
+@click.option('-t', '--threads', '--jobs', 'threads', default=os.cpu_count() or 1, type=click.IntRange(min=1),
+              help='Number of parallel dump workers (default: number of CPUs)')
+@click.option('--chunk-rows', default=0, type=click.IntRange(min=0),
+              help='Dump tables with more rows than this as parallel key ranges of about this many rows (default: off)')
+@click.option('--engine', '--backend', 'engine', type=click.Choice(['auto', 'mysqldump', 'mydumper']), default='auto',
+              help='Dump engine: mydumper (parallel per-table dumps) or mysqldump; auto (default) uses mydumper if installed')
+def backup(host, user, password, port, output, no_wire_compress, threads, chunk_rows, engine):
     """
     MySQL Backup Tool - Tool for creating MySQL database backups
     
@@ -551,6 +1443,7 @@ def backup(host, user, password, port, output):
     - -o /path/to/dir: Uses specified directory
     - -o /path/to/backup.tar.gz: Creates backup with exact filename
     - -o backup.tar.gz: Creates backup.tar.gz in current directory
+    - -o backup.tar / backup.tar.zst: Plain tar, or tar compressed with zstd
     
     Usage examples:
     
@@ -574,8 +1467,37 @@ def backup(host, user, password, port, output):
         console.print("[red]Error: You must specify -p to enter password[/red]")
         sys.exit(1)
     
-    # Create tool instance
-    backup_tool = MySQLBackupTool(host, user, db_password, port, output)
+    # Protocol compression only pays off when the server is across a network
+    compress = not no_wire_compress and host not in LOCAL_HOSTS
+    
+    if output and output.endswith('.tar.zst') and not shutil.which('zstd'):
+        try:
+            import zstandard  # noqa: F401 - used in-process instead of the binary
+        except ImportError:
+            console.print("[red]Error: .tar.zst backups need the zstd binary or the zstandard package[/red]")
+            sys.exit(1)
+    
+    if engine == 'auto':
+        engine = 'mydumper' if shutil.which('mydumper') else 'mysqldump'
+    
+    if engine == 'mysqldump' and not shutil.which('mysqldump'):
+        # Fail before connecting rather than on the first dump
+        console.print("[red]Error: mysqldump not found in PATH[/red]")
+        console.print("[yellow]Make sure MySQL client is installed[/yellow]")
+        sys.exit(1)
+    
+    if engine == 'mydumper':
+        if not shutil.which('mydumper'):
+            console.print("[red]Error: mydumper not found in PATH[/red]")
+            sys.exit(1)
+        # mydumper parallelizes inside each database, so dump one database at a time
+        backup_tool = MySQLBackupTool(host, user, db_password, port, output, threads=1,
+                                      compress=compress, backend='mydumper',
+                                      mydumper_threads=threads, chunk_rows=chunk_rows)
+    else:
+        # Create tool instance
+        backup_tool = MySQLBackupTool(host, user, db_password, port, output,
+                                      threads=threads, compress=compress, chunk_rows=chunk_rows)
     
     try:
         # Connect to MySQL
@@ -625,8 +1547,9 @@ def backup(host, user, password, port, output):
 @click.option('-u', '--user', required=True, help='MySQL username')
 @click.option('-p', '--password', is_flag=True, help='Prompt for password')
 @click.option('-P', '--port', default=3306, help='MySQL server port')
-@click.option('-f', '--file', required=True, help='Path to tar.gz backup file to restore')
-def restore(host, user, password, port, file):
+@click.option('-f', '--file', required=True, help='Path to backup file to restore (.tar.gz, .tar or .tar.zst)')
+@click.option('-t', '--threads', default=4, type=click.IntRange(min=1), help='Number of databases restored in parallel (myloader threads for mydumper backups)')
+def restore(host, user, password, port, file, threads):
     """
     MySQL Restore Tool - Tool for restoring MySQL databases from tar.gz backups
     
@@ -651,7 +1574,8 @@ def restore(host, user, password, port, file):
         sys.exit(1)
     
     # Create restore tool instance
-    restore_tool = MySQLRestoreTool(host, user, db_password, port)
+    restore_tool = MySQLRestoreTool(host, user, db_password, port, threads=threads,
+                                    myloader_threads=threads)
     
     try:
         # Restore backup
@@ -3,6 +3,7 @@
 Configuration and verification script for mdump
 """
 
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -10,10 +11,12 @@ from pathlib import Path
 def check_mysql_client():
     """Verifies if mysqldump is available"""
     try:
-        result = subprocess.run(['mysqldump', '--version'], 
+        mysqldump = shutil.which('mysqldump') or 'mysqldump'
+        result = subprocess.run([mysqldump, '--version'], 
                               capture_output=True, text=True)
         if result.returncode == 0:
-            print("✓ mysqldump found:", result.stdout.strip())
+            print(f"✓ mysqldump found ({mysqldump}):", result.stdout.strip())
+            check_mydumper()
             return True
         else:
             print("✗ mysqldump is not working properly")
@@ -26,9 +29,19 @@ def check_mysql_client():
         print("sudo apt-get install mysql-client")
         return False
 
+def check_mydumper():
+    """Reports whether mydumper/myloader are available (optional)"""
+    mydumper = shutil.which('mydumper')
+    if mydumper:
+        print("✓ mydumper found:", mydumper, "(used by default for parallel backups)")
+    else:
+        print("- mydumper not found (optional; backups will use mysqldump)")
+    if mydumper and not shutil.which('myloader'):
+        print("✗ myloader not found in PATH (needed to restore mydumper backups)")
+
 def check_python_packages():
     """Verifies that Python packages are installed"""
-    required_packages = ['mysql.connector', 'click', 'rich', 'tabulate']
+    required_packages = ['mysql.connector', 'click', 'rich', 'zstandard']
     missing_packages = []
     
     for package in required_packages:
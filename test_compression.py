@@ -2,10 +2,13 @@
 """
 Test script to verify tar.gz compression functionality
 """
+import io
 import tarfile
 import tempfile
 from pathlib import Path
 
+import mdump
+
 def test_tar_compression():
     """Test creating a tar.gz file"""
     # Create temporary files to compress
@@ -43,6 +46,45 @@ def test_tar_compression():
             print(f"❌ Error creating tar.gz: {e}")
             return False
 
+def test_tar_zst_archive_without_zstd_binary(tmp_path, monkeypatch):
+    """mdump writes and reads .tar.zst backups through zstandard when zstd isn't installed"""
+    # No zstd (or pigz/gzip) binary on PATH
+    monkeypatch.setattr(mdump.shutil, 'which', lambda name: None)
+    
+    dump = tmp_path / "database1.sql.zst"
+    dump.write_bytes(b"compressed dump bytes")
+    archive = tmp_path / "backup.tar.zst"
+    
+    tool = mdump.MySQLBackupTool('localhost', 'root', 'secret', output_path=str(archive))
+    try:
+        assert tool.zstd_path is None
+        with open(archive, 'wb') as raw:
+            tf, zstd = tool.open_archive(raw, '.tar.zst')
+            tf.add(dump, arcname=dump.name)
+            assert tool.close_archive(tf, zstd) is None
+    finally:
+        tool.close_connection()
+    
+    # Read it back the way restore does
+    tar_bytes = io.BytesIO()
+    with open(archive, 'rb') as src:
+        mdump.copy_zstd(src, tar_bytes)
+    tar_bytes.seek(0)
+    with tarfile.open(fileobj=tar_bytes, mode='r:') as tf:
+        assert tf.getnames() == [dump.name]
+        assert tf.extractfile(dump.name).read() == b"compressed dump bytes"
+    
+    restore_tool = mdump.MySQLRestoreTool('localhost', 'root', 'secret')
+    try:
+        tmp_tar = restore_tool.decompress_zstd(archive)
+        assert tmp_tar is not None
+        try:
+            assert tmp_tar.read_bytes() == tar_bytes.getvalue()
+        finally:
+            tmp_tar.unlink()
+    finally:
+        restore_tool.close_connection()
+
 if __name__ == "__main__":
     print("Testing tar.gz compression functionality...")
     success = test_tar_compression()
@@ -50,3 +92,4 @@ if __name__ == "__main__":
         print("\n🎉 Tar.gz compression test passed!")
     else:
         print("\n💥 Tar.gz compression test failed!")
+
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Tests for mdump helpers that don't need a MySQL server
+"""
+import configparser
+import errno
+import io
+import os
+import re
+import stat
+import sys
+import threading
+import time
+from collections import deque
+
+import pytest
+
+import mdump
+
+
+@pytest.fixture
+def backup_tool(tmp_path):
+    """A MySQLBackupTool writing into a temporary directory, never connected"""
+    tool = mdump.MySQLBackupTool('localhost', 'root', 'secret', output_path=str(tmp_path))
+    yield tool
+    tool.close_connection()
+
+
+class FakeDump:
+    """Stands in for a mysqldump Popen: a stderr stream and a terminate() counter"""
+    def __init__(self, stderr):
+        self.stderr = io.BytesIO(stderr)
+        self.terminated = 0
+
+    def terminate(self):
+        self.terminated += 1
+
+
+def test_watch_stderr_keeps_warnings_running(backup_tool):
+    """GTID and deprecation notices are not errors"""
+    dump = FakeDump(
+        b"Warning: A partial dump from a server that has GTIDs will by default include the GTIDs of all transactions\n"
+        b"mysqldump: Deprecated program name. It will be removed in a future release, use '/usr/bin/mariadb-dump' instead\n"
+    )
+    lines = deque()
+    backup_tool._watch_stderr(dump, lines)
+    assert dump.terminated == 0
+    assert len(lines) == 2
+
+
+def test_watch_stderr_stops_on_error(backup_tool):
+    """A real error line terminates the dump"""
+    dump = FakeDump(
+        b"Warning: A partial dump from a server that has GTIDs will by default include the GTIDs of all transactions\n"
+        b"mysqldump: Got error: 1049: Unknown database 'nope' when selecting the database\n"
+    )
+    lines = deque()
+    backup_tool._watch_stderr(dump, lines)
+    assert dump.terminated == 1
+    assert b"Got error" in lines[-1]
+
+
+def test_watch_stderr_keeps_only_the_tail(backup_tool):
+    """stderr is bounded to about STDERR_TAIL bytes"""
+    line = b"Warning: something\n"
+    dump = FakeDump(line * (mdump.STDERR_TAIL // len(line) * 3))
+    lines = deque()
+    backup_tool._watch_stderr(dump, lines)
+    assert sum(map(len, lines)) <= mdump.STDERR_TAIL
+
+
+def test_chunked_dump_order(backup_tool):
+    """Chunked tables get their triggers after their rows, and views come last"""
+    cmds = backup_tool._chunked_dump_argvs('shop', [('orders', 'id', [100, 200])], ['order_totals'])
+    
+    # The rest of the database leaves out the chunked table and the views
+    assert '--ignore-table=shop.orders' in cmds[0]
+    assert '--ignore-table=shop.order_totals' in cmds[0]
+    
+    schema, *chunks, triggers, views = cmds[1:]
+    assert schema[-2:] == ['shop', 'orders'] and '--no-data' in schema
+    assert schema.index('--skip-triggers') > schema.index('--triggers')
+    assert [c[-3] for c in chunks] == ['--where=`id` < 100', '--where=`id` >= 100 AND `id` < 200',
+                                       '--where=`id` >= 200']
+    for chunk in chunks:
+        assert chunk.index('--skip-triggers') > chunk.index('--triggers')
+    assert triggers[-2:] == ['shop', 'orders'] and '--skip-triggers' not in triggers
+    assert '--no-create-info' in triggers and '--no-data' in triggers
+    assert views[-2:] == ['shop', 'order_totals']
+
+
+def test_run_dump_kills_mysqldump_when_writing_fails(backup_tool, tmp_path, monkeypatch):
+    """A failed write doesn't leave the dump process blocked on its pipe"""
+    class FullDisk(io.RawIOBase):
+        def __enter__(self):
+            return self
+        
+        def write(self, data):
+            raise OSError(errno.ENOSPC, "No space left on device")
+    
+    backup_tool.pigz_path = backup_tool.gzip_path = None
+    monkeypatch.setattr(mdump, 'open_gzip', lambda fileobj, mode: FullDisk())
+    # Writes far more than a pipe buffer holds
+    cmd = [sys.executable, '-c', 'import sys; sys.stdout.write("x" * (16 << 20))']
+    
+    with pytest.raises(OSError):
+        backup_tool._run_dump(cmd, tmp_path / 'db.sql.gz', 'db')
+    assert backup_tool._running['db'].poll() is not None
+
+
+def _sleeping_parts(backup_tool, monkeypatch, count, first=None):
+    """Makes _chunked_dump_argvs return count parts that each sleep for 5 seconds"""
+    sleep = [sys.executable, '-c', 'import time; time.sleep(5)']
+    cmds = [first or sleep] + [sleep] * (count - 1)
+    monkeypatch.setattr(backup_tool, '_chunked_dump_argvs', lambda db_name, tables, views: cmds)
+    backup_tool.pigz_path = backup_tool.gzip_path = None
+    backup_tool.threads = 2
+    backup_tool._dump_slots = threading.Semaphore(2)
+
+
+def test_chunked_dump_stops_on_interrupt(backup_tool, tmp_path, monkeypatch):
+    """After terminate_dumps, running parts are stopped and queued parts never start"""
+    _sleeping_parts(backup_tool, monkeypatch, 6)
+    threading.Timer(0.5, backup_tool.terminate_dumps).start()
+    
+    started = time.monotonic()
+    error = backup_tool._dump_chunked('shop', tmp_path / 'shop.sql.gz', [], [])
+    assert error is not None
+    assert time.monotonic() - started < 4
+    assert set(backup_tool._running) == {'shop.0', 'shop.1'}
+    assert not list(tmp_path.iterdir())
+
+
+def test_chunked_dump_stops_siblings_of_a_failed_part(backup_tool, tmp_path, monkeypatch):
+    """One failed part stops the others instead of waiting for them"""
+    _sleeping_parts(backup_tool, monkeypatch, 6, first=[sys.executable, '-c', 'import sys; sys.exit(2)'])
+    
+    started = time.monotonic()
+    error = backup_tool._dump_chunked('shop', tmp_path / 'shop.sql.gz', [], [])
+    assert error is not None
+    assert time.monotonic() - started < 4
+    assert 'shop.5' not in backup_tool._running
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize('selection, expected', [
+    ('1,3-5,7', [1, 3, 4, 5, 7]),
+    ('1-3,2-5', [1, 2, 3, 4, 5]),
+    ('5,1,5,1-2', [1, 2, 5]),
+    (' 2 - 3 , 9 ', [2, 3, 9]),
+    ('1-1', [1]),
+])
+def test_parse_selection(backup_tool, selection, expected):
+    """Selections come back sorted, each number once"""
+    assert backup_tool.parse_selection(selection, 10) == expected
+
+
+@pytest.mark.parametrize('selection, message', [
+    ('0', 'Number out of range: 0'),
+    ('11', 'Number out of range: 11'),
+    ('3-11', 'Invalid range: 3-11'),
+    ('5-3', 'Invalid range: 5-3'),
+    ('abc', 'Not a number or range: abc'),
+    ('1,,2', 'Not a number or range: '),
+    ('1-2-3', 'Not a number or range: 1-2-3'),
+    ('-1', 'Not a number or range: -1'),
+])
+def test_parse_selection_rejects(backup_tool, selection, message):
+    """Out-of-range numbers and malformed items raise ValueError"""
+    with pytest.raises(ValueError) as excinfo:
+        backup_tool.parse_selection(selection, 10)
+    assert str(excinfo.value) == message
+
+
+def test_chunk_conditions():
+    """Ranges cover the whole key space: open at both ends, half-open in between"""
+    assert list(mdump.chunk_conditions('id', [10])) == ['`id` < 10', '`id` >= 10']
+    assert list(mdump.chunk_conditions('id', [10, 20, 30])) == [
+        '`id` < 10',
+        '`id` >= 10 AND `id` < 20',
+        '`id` >= 20 AND `id` < 30',
+        '`id` >= 30',
+    ]
+
+
+def test_chunk_conditions_quotes_the_key():
+    """Backticks in the column name can't break out of the identifier"""
+    assert list(mdump.chunk_conditions('a`b', [5])) == ['`a``b` < 5', '`a``b` >= 5']
+
+
+def test_backup_tool_bad_output_path_leaves_no_credentials(tmp_path, monkeypatch):
+    """An output path that can't be created doesn't leave the defaults file behind"""
+    written = []
+    write_defaults_file = mdump.write_defaults_file
+    monkeypatch.setattr(mdump, 'write_defaults_file', lambda *args: written.append(write_defaults_file(*args)) or written[-1])
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    
+    with pytest.raises(OSError):
+        mdump.MySQLBackupTool('localhost', 'root', 'secret', output_path=str(blocker / 'backups'))
+    assert not any(os.path.exists(path) for path in written)
+
+
+@pytest.mark.parametrize('password', [
+    'plain',
+    'with space',
+    'quote"inside',
+    'back\\slash',
+    'ends with backslash\\',
+    'hash#and;semicolon',
+    "single'quote",
+    'line\nuser=root',
+    'carriage\rreturn',
+    '',
+])
+def test_write_defaults_file_quotes_password(password):
+    """The password reads back unchanged with MySQL option file quoting rules"""
+    path = mdump.write_defaults_file('db.example.com', 'backup', password, 3307)
+    try:
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        config = configparser.ConfigParser(interpolation=None)
+        config.read(path)
+        client = config['client']
+        assert client['host'] == 'db.example.com'
+        assert client['port'] == '3307'
+        assert client['user'] == 'backup'
+        
+        # A line break in the password can't smuggle in another option
+        assert set(client) == {'host', 'port', 'user', 'password'}
+        
+        # MySQL strips the double quotes and unescapes backslash sequences
+        value = client['password']
+        assert value.startswith('"') and value.endswith('"')
+        escapes = {'n': '\n', 'r': '\r'}
+        unescaped = re.sub(r'\\(.)', lambda m: escapes.get(m.group(1), m.group(1)), value[1:-1])
+        assert unescaped == password
+    finally:
+        os.unlink(path)